@@ -276,14 +276,13 @@ class _PokerPageState extends State<PokerPage> {
                         });
                       },
                       items: Suit.values.map((Suit suit) {
+                        final previewCard = Card(suit: suit, rank: Rank.ace);
                         return DropdownMenuItem<Suit>(
                           value: suit,
                           child: Text(
-                            Card(suit: suit, rank: Rank.ace).suitString,
+                            previewCard.suitString,
                             style: TextStyle(
-                                color:
-                                    Card(suit: suit, rank: Rank.ace).suitColor,
-                                fontSize: 24),
+                                color: previewCard.suitColor, fontSize: 24),
                           ),
                         );
                       }).toList(),